@@ -27,10 +27,16 @@ mkdir -p "$MODEL_SERVICE_DIR"
 echo "2a. Generating model training script ($MODEL_ARTIFACT_DIR/$TRAIN_SCRIPT)..."
 cat << EOF > "$MODEL_ARTIFACT_DIR/$TRAIN_SCRIPT"
 import joblib
+import json
+import numpy as np
+import sklearn
 from sklearn.datasets import load_iris
 from sklearn.linear_model import LogisticRegression
 import os
 
+# Bump when the compact artifact layout changes; inference_code.py checks it on load
+COMPACT_FORMAT_VERSION = 1
+
 print("Training a simple Logistic Regression model on Iris dataset...")
 X, y = load_iris(return_X_y=True)
 model = LogisticRegression(solver='liblinear', multi_class='ovr', max_iter=1000)
@@ -39,28 +45,100 @@ model.fit(X, y)
 model_path = os.path.join(os.path.dirname(__file__), "model.pkl")
 joblib.dump(model, model_path)
 print(f"Model trained and saved to {model_path}")
+
+# Compact, pickle-free export: one float32 .npy (row i = [coef_i..., intercept_i])
+# that can be memory-mapped, plus a small JSON metadata file.
+weights = np.hstack([model.coef_, model.intercept_[:, None]]).astype(np.float32)
+weights_file = "model.f32.npy"
+np.save(os.path.join(os.path.dirname(__file__), weights_file), weights, allow_pickle=False)
+meta = {
+    "format_version": COMPACT_FORMAT_VERSION,
+    "model_type": "linear_classifier",
+    "dtype": "float32",
+    "weights_file": weights_file,
+    "shape": list(weights.shape),
+    "n_features": int(model.coef_.shape[1]),
+    "classes": model.classes_.tolist(),
+    "sklearn_version": sklearn.__version__,
+}
+meta_path = os.path.join(os.path.dirname(__file__), "model.meta.json")
+with open(meta_path, "w") as f:
+    json.dump(meta, f, indent=2)
+print(f"Compact float32 artifact exported to {meta_path} ({weights.nbytes} bytes of weights)")
 EOF
 
 # model_artifact/inference_code.py
 echo "2b. Generating model inference code ($MODEL_ARTIFACT_DIR/$INFERENCE_CODE)..."
 cat << EOF > "$MODEL_ARTIFACT_DIR/$INFERENCE_CODE"
-import joblib
+import json
 import os
+from functools import partial
 import numpy as np
 
-MODEL_PATH = os.path.join(os.path.dirname(__file__), "model.pkl")
+MODEL_DIR = os.path.dirname(__file__)
+MODEL_PATH = os.path.join(MODEL_DIR, "model.pkl")
+COMPACT_META_PATH = os.path.join(MODEL_DIR, "model.meta.json")
+COMPACT_FORMAT_VERSION = 1
 _model = None
+_compact = None
 
 def load_model():
     global _model
     if _model is None:
         if not os.path.exists(MODEL_PATH):
             raise FileNotFoundError(f"Model file not found at {MODEL_PATH}. Please ensure model.pkl is present.")
+        import joblib # Only the pickle path needs joblib/scikit-learn
         print(f"Loading model from {MODEL_PATH}...")
         _model = joblib.load(MODEL_PATH)
         print("Model loaded successfully.")
     return _model
 
+def load_compact_model(mmap=True):
+    """Load the pickle-free float32 artifact written by train_model.py."""
+    global _compact
+    if _compact is None:
+        if not os.path.exists(COMPACT_META_PATH):
+            raise FileNotFoundError(f"Compact model metadata not found at {COMPACT_META_PATH}. Run train_model.py to export it.")
+        with open(COMPACT_META_PATH) as f:
+            meta = json.load(f)
+        if meta.get("format_version") != COMPACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact model format version {meta.get('format_version')} (expected {COMPACT_FORMAT_VERSION}).")
+        weights = np.load(os.path.join(MODEL_DIR, meta["weights_file"]), mmap_mode="r" if mmap else None, allow_pickle=False)
+        if list(weights.shape) != meta["shape"] or weights.shape[1] != meta["n_features"] + 1:
+            raise ValueError(f"Compact model weights shape {weights.shape} does not match metadata.")
+        _compact = {
+            "coef": weights[:, :-1],
+            "intercept": weights[:, -1],
+            "classes": np.asarray(meta["classes"]),
+            "n_features": meta["n_features"],
+        }
+    return _compact
+
+def _predict_compact(X, compact):
+    X = np.asarray(X, dtype=np.float32)
+    if X.ndim != 2 or X.shape[1] != compact["n_features"]:
+        raise ValueError(f"Expected a 2-D array with {compact['n_features']} features, got shape {X.shape}.")
+    scores = X @ compact["coef"].T + compact["intercept"]
+    if scores.shape[1] == 1: # Binary model stores a single decision row
+        return compact["classes"][(scores[:, 0] > 0).astype(np.intp)]
+    return compact["classes"][scores.argmax(axis=1)]
+
+def predict_batch(data):
+    """Predict labels for a 2-D array (n_samples, n_features) or an iterator of such chunks.
+
+    Uses the compact float32 artifact when present, otherwise the pickled model.
+    Returns a 1-D numpy array of labels.
+    """
+    try:
+        predict_fn = partial(_predict_compact, compact=load_compact_model())
+    except FileNotFoundError:
+        predict_fn = load_model().predict
+
+    if isinstance(data, (np.ndarray, list)):
+        return predict_fn(data)
+    results = [predict_fn(chunk) for chunk in data]
+    return np.concatenate(results) if results else np.empty(0, dtype=np.int64)
+
 def predict(data_point):
     model = load_model()
     # Ensure data_point is a 2D array, even for a single sample
@@ -82,6 +160,8 @@ if __name__ == "__main__":
     print(f"Sample input: {sample_input}")
     prediction = predict(sample_input)
     print(f"Prediction for sample input: {prediction}")
+    batch = np.array([sample_input, [6.7, 3.0, 5.2, 2.3]])
+    print(f"Batch predictions: {predict_batch(batch).tolist()}")
 EOF
 
 # model_artifact/requirements.txt
@@ -278,14 +358,14 @@ if python3 -m venv "$VENV_DIR" 2>/dev/null; then
   pip install -q -r "$MODEL_ARTIFACT_DIR/requirements.txt"
   USE_VENV=1
   echo "3. Dependencies installed in virtual environment."
-  echo "4. Training the model and creating model.pkl..."
+  echo "4. Training the model and creating model.pkl + compact float32 artifact..."
   python "$MODEL_ARTIFACT_DIR/$TRAIN_SCRIPT"
   DID_LOCAL_TRAIN=1
 elif python3 -m pip --version >/dev/null 2>&1; then
   echo "3. Using python3 -m pip (no venv)..."
   python3 -m pip install -q --user flask gunicorn
   python3 -m pip install -q --user -r "$MODEL_ARTIFACT_DIR/requirements.txt"
-  echo "4. Training the model and creating model.pkl..."
+  echo "4. Training the model and creating model.pkl + compact float32 artifact..."
   python "$MODEL_ARTIFACT_DIR/$TRAIN_SCRIPT"
   DID_LOCAL_TRAIN=1
 else
@@ -357,6 +437,9 @@ for f in "$MODEL_ARTIFACT_DIR/$TRAIN_SCRIPT" "$MODEL_ARTIFACT_DIR/$INFERENCE_COD
 done
 if [ -n "$DID_LOCAL_TRAIN" ]; then
   [ -f "$MODEL_ARTIFACT_DIR/model.pkl" ] && echo "  OK $MODEL_ARTIFACT_DIR/model.pkl" || { echo "  MISSING model.pkl"; exit 1; }
+  for f in model.meta.json model.f32.npy; do
+    [ -f "$MODEL_ARTIFACT_DIR/$f" ] && echo "  OK $MODEL_ARTIFACT_DIR/$f" || { echo "  MISSING $f"; exit 1; }
+  done
 fi
 echo "  All generated files present."
 
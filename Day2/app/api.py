@@ -1,21 +1,85 @@
+import time
+_PROCESS_START = time.perf_counter()
+
 from flask import Flask, request, jsonify
-import joblib
 import numpy as np
 import os
+import threading
+
+_IMPORTS_DONE = time.perf_counter()
 
 app = Flask(__name__)
 MODEL_PATH = os.environ.get('MODEL_PATH', 'app/model.pkl')
+# 'eager' loads and warms the model before the module finishes importing (default).
+# 'fast' binds the server immediately and loads/warms in a background thread;
+# /ready reports 503 until that finishes, so the orchestrator holds traffic back.
+STARTUP_MODE = os.environ.get('STARTUP_MODE', 'eager').lower()
+WARMUP_BATCHES = int(os.environ.get('WARMUP_BATCHES', '3'))
+WARMUP_BATCH_SIZE = int(os.environ.get('WARMUP_BATCH_SIZE', '32'))
+
+model = None
+ready = False
+startup_error = None
+# Startup phase breakdown in milliseconds, exposed on /ready
+startup_phases = {'imports_ms': round((_IMPORTS_DONE - _PROCESS_START) * 1000, 2)}
+
+def load_model():
+    # joblib is only needed to unpickle the model, so keep it off the import path
+    import joblib
+    return joblib.load(MODEL_PATH)
+
+def warm_up(m):
+    # Run dummy batches through both inference calls used by /predict so the
+    # first real request does not pay for lazy allocations and code-path setup.
+    n_features = getattr(m, 'n_features_in_', 2)
+    dummy = np.zeros((WARMUP_BATCH_SIZE, n_features))
+    for _ in range(WARMUP_BATCHES):
+        m.predict(dummy)
+        m.predict_proba(dummy)
+
+def startup():
+    global model, ready, startup_error
+    try:
+        t0 = time.perf_counter()
+        loaded = load_model()
+        t1 = time.perf_counter()
+        startup_phases['model_load_ms'] = round((t1 - t0) * 1000, 2)
+        print(f"API: Model loaded successfully from {MODEL_PATH}")
+        warm_up(loaded)
+        t2 = time.perf_counter()
+        startup_phases['warmup_ms'] = round((t2 - t1) * 1000, 2)
+        startup_phases['total_ms'] = round((t2 - _PROCESS_START) * 1000, 2)
+        model = loaded
+        ready = True
+        print(f"API: Ready ({STARTUP_MODE} startup) - phases: {startup_phases}")
+    except Exception as e:
+        startup_error = str(e)
+        print(f"API: Error loading model from {MODEL_PATH}: {e}")
+        model = None # Handle case where model might not be available yet
+
+if STARTUP_MODE == 'fast':
+    threading.Thread(target=startup, name='model-startup', daemon=True).start()
+else:
+    startup()
+
+@app.route('/health', methods=['GET'])
+def health():
+    # Liveness: the process is up and serving HTTP, regardless of model state
+    return jsonify({'status': 'ok', 'service': 'api'}), 200
 
-try:
-    model = joblib.load(MODEL_PATH)
-    print(f"API: Model loaded successfully from {MODEL_PATH}")
-except Exception as e:
-    print(f"API: Error loading model from {MODEL_PATH}: {e}")
-    model = None # Handle case where model might not be available yet
+@app.route('/ready', methods=['GET'])
+def readiness():
+    # Readiness: model loaded and warmed up, safe to route traffic here
+    body = {'ready': ready, 'startup_mode': STARTUP_MODE, 'startup_phases': startup_phases}
+    if startup_error:
+        body['error'] = startup_error
+    return jsonify(body), (200 if ready else 503)
 
 @app.route('/predict', methods=['POST'])
 def predict():
     if model is None:
+        if STARTUP_MODE == 'fast' and startup_error is None:
+            return jsonify({'error': 'Model warming up'}), 503
         return jsonify({'error': 'Model not loaded'}), 500
     try:
         data = request.json.get('features')
@@ -2,7 +2,6 @@ import requests
 import numpy as np
 import time
 import os
-from sklearn.datasets import make_classification
 
 API_URL = os.environ.get('API_URL', 'http://localhost:5000/predict')
 MONITOR_INTERVAL = int(os.environ.get('MONITOR_INTERVAL', '5'))
@@ -10,6 +9,8 @@ DRIFT_ITERATIONS = int(os.environ.get('DRIFT_ITERATIONS', '3'))
 ACCURACY_THRESHOLD = float(os.environ.get('ACCURACY_THRESHOLD', '0.90')) # 90%
 N_SAMPLES_PER_CHECK = 50
 METRICS_FILE = os.environ.get('METRICS_FILE', 'metrics.json')
+READY_URL = os.environ.get('READY_URL', API_URL.rsplit('/', 1)[0] + '/ready')
+READY_TIMEOUT = int(os.environ.get('READY_TIMEOUT', '60'))
 
 # --- Colors for console output ---
 GREEN='\033[0;32m'
@@ -18,6 +19,8 @@ RED='\033[0;31m'
 NC='\033[0m' # No Color
 
 def generate_data(drift_active=False):
+    # Deferred import: sklearn is only needed here, so keep it off the startup path
+    from sklearn.datasets import make_classification
     # Base data generation (consistent with training)
     X, _ = make_classification(n_samples=N_SAMPLES_PER_CHECK, n_features=2, n_informative=2, n_redundant=0, random_state=int(time.time()))
 
@@ -40,6 +43,20 @@ def get_simulated_accuracy(confidences, drift_active):
         # When no drift, simulate high accuracy
         return np.random.uniform(0.92, 0.98) # e.g., 92-98%
 
+def wait_for_api_ready():
+    # Hold the first check until the API reports it is loaded and warmed up
+    deadline = time.time() + READY_TIMEOUT
+    while time.time() < deadline:
+        try:
+            if requests.get(READY_URL, timeout=2).status_code == 200:
+                print(f"[{time.strftime('%H:%M:%S')}] {GREEN}Monitor: API is ready.{NC}")
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(1)
+    print(f"[{time.strftime('%H:%M:%S')}] {YELLOW}Monitor: API not ready after {READY_TIMEOUT}s, starting checks anyway.{NC}")
+    return False
+
 def run_monitor():
     print(f"{GREEN}--- MLOps Model Monitor Started ---{NC}")
     print(f"{YELLOW}API URL: {API_URL}{NC}")
@@ -47,6 +64,7 @@ def run_monitor():
     print(f"{YELLOW}Drift after: {DRIFT_ITERATIONS} iterations{NC}")
     print(f"{YELLOW}Accuracy Threshold: {ACCURACY_THRESHOLD*100:.0f}%{NC}")
     print(f"{GREEN}-----------------------------------{NC}")
+    wait_for_api_ready()
 
     iteration = 0
     total_predictions = 0
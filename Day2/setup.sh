@@ -61,6 +61,7 @@ function display_dashboard() {
     echo -e "\n${GREEN}--- MLOps Demo Dashboard ---${NC}"
     echo -e "${YELLOW}Dashboard: http://localhost:${DASHBOARD_PORT}${NC}"
     echo -e "${YELLOW}API Service: http://localhost:${API_PORT}/predict${NC}"
+    echo -e "${YELLOW}API Liveness/Readiness: http://localhost:${API_PORT}/health | /ready${NC}"
     echo -e "${YELLOW}Monitor Log: monitor.log | API Log: api.log | Metrics: metrics.json${NC}"
     if [ -f "metrics.json" ]; then
         echo -e "${GREEN}Current metrics (updated by monitor):${NC}"
@@ -175,24 +176,88 @@ else # Native execution
     # --- Generate API source code ---
     echo -e "${YELLOW}Generating API source code (app/api.py)...${NC}"
     cat <<EOF > app/api.py
+import time
+_PROCESS_START = time.perf_counter()
+
 from flask import Flask, request, jsonify
-import joblib
 import numpy as np
 import os
+import threading
+
+_IMPORTS_DONE = time.perf_counter()
 
 app = Flask(__name__)
 MODEL_PATH = os.environ.get('MODEL_PATH', 'app/model.pkl')
-
-try:
-    model = joblib.load(MODEL_PATH)
-    print(f"API: Model loaded successfully from {MODEL_PATH}")
-except Exception as e:
-    print(f"API: Error loading model from {MODEL_PATH}: {e}")
-    model = None # Handle case where model might not be available yet
+# 'eager' loads and warms the model before the module finishes importing (default).
+# 'fast' binds the server immediately and loads/warms in a background thread;
+# /ready reports 503 until that finishes, so the orchestrator holds traffic back.
+STARTUP_MODE = os.environ.get('STARTUP_MODE', 'eager').lower()
+WARMUP_BATCHES = int(os.environ.get('WARMUP_BATCHES', '3'))
+WARMUP_BATCH_SIZE = int(os.environ.get('WARMUP_BATCH_SIZE', '32'))
+
+model = None
+ready = False
+startup_error = None
+# Startup phase breakdown in milliseconds, exposed on /ready
+startup_phases = {'imports_ms': round((_IMPORTS_DONE - _PROCESS_START) * 1000, 2)}
+
+def load_model():
+    # joblib is only needed to unpickle the model, so keep it off the import path
+    import joblib
+    return joblib.load(MODEL_PATH)
+
+def warm_up(m):
+    # Run dummy batches through both inference calls used by /predict so the
+    # first real request does not pay for lazy allocations and code-path setup.
+    n_features = getattr(m, 'n_features_in_', 2)
+    dummy = np.zeros((WARMUP_BATCH_SIZE, n_features))
+    for _ in range(WARMUP_BATCHES):
+        m.predict(dummy)
+        m.predict_proba(dummy)
+
+def startup():
+    global model, ready, startup_error
+    try:
+        t0 = time.perf_counter()
+        loaded = load_model()
+        t1 = time.perf_counter()
+        startup_phases['model_load_ms'] = round((t1 - t0) * 1000, 2)
+        print(f"API: Model loaded successfully from {MODEL_PATH}")
+        warm_up(loaded)
+        t2 = time.perf_counter()
+        startup_phases['warmup_ms'] = round((t2 - t1) * 1000, 2)
+        startup_phases['total_ms'] = round((t2 - _PROCESS_START) * 1000, 2)
+        model = loaded
+        ready = True
+        print(f"API: Ready ({STARTUP_MODE} startup) - phases: {startup_phases}")
+    except Exception as e:
+        startup_error = str(e)
+        print(f"API: Error loading model from {MODEL_PATH}: {e}")
+        model = None # Handle case where model might not be available yet
+
+if STARTUP_MODE == 'fast':
+    threading.Thread(target=startup, name='model-startup', daemon=True).start()
+else:
+    startup()
+
+@app.route('/health', methods=['GET'])
+def health():
+    # Liveness: the process is up and serving HTTP, regardless of model state
+    return jsonify({'status': 'ok', 'service': 'api'}), 200
+
+@app.route('/ready', methods=['GET'])
+def readiness():
+    # Readiness: model loaded and warmed up, safe to route traffic here
+    body = {'ready': ready, 'startup_mode': STARTUP_MODE, 'startup_phases': startup_phases}
+    if startup_error:
+        body['error'] = startup_error
+    return jsonify(body), (200 if ready else 503)
 
 @app.route('/predict', methods=['POST'])
 def predict():
     if model is None:
+        if STARTUP_MODE == 'fast' and startup_error is None:
+            return jsonify({'error': 'Model warming up'}), 503
         return jsonify({'error': 'Model not loaded'}), 500
     try:
         data = request.json.get('features')
@@ -224,7 +289,6 @@ import requests
 import numpy as np
 import time
 import os
-from sklearn.datasets import make_classification
 
 API_URL = os.environ.get('API_URL', 'http://localhost:${API_PORT}/predict')
 MONITOR_INTERVAL = int(os.environ.get('MONITOR_INTERVAL', '${MONITOR_INTERVAL}'))
@@ -232,6 +296,8 @@ DRIFT_ITERATIONS = int(os.environ.get('DRIFT_ITERATIONS', '${DRIFT_ITERATIONS}')
 ACCURACY_THRESHOLD = float(os.environ.get('ACCURACY_THRESHOLD', '0.90')) # 90%
 N_SAMPLES_PER_CHECK = 50
 METRICS_FILE = os.environ.get('METRICS_FILE', 'metrics.json')
+READY_URL = os.environ.get('READY_URL', API_URL.rsplit('/', 1)[0] + '/ready')
+READY_TIMEOUT = int(os.environ.get('READY_TIMEOUT', '60'))
 
 # --- Colors for console output ---
 GREEN='\033[0;32m'
@@ -240,6 +306,8 @@ RED='\033[0;31m'
 NC='\033[0m' # No Color
 
 def generate_data(drift_active=False):
+    # Deferred import: sklearn is only needed here, so keep it off the startup path
+    from sklearn.datasets import make_classification
     # Base data generation (consistent with training)
     X, _ = make_classification(n_samples=N_SAMPLES_PER_CHECK, n_features=2, n_informative=2, n_redundant=0, random_state=int(time.time()))
 
@@ -262,6 +330,20 @@ def get_simulated_accuracy(confidences, drift_active):
         # When no drift, simulate high accuracy
         return np.random.uniform(0.92, 0.98) # e.g., 92-98%
 
+def wait_for_api_ready():
+    # Hold the first check until the API reports it is loaded and warmed up
+    deadline = time.time() + READY_TIMEOUT
+    while time.time() < deadline:
+        try:
+            if requests.get(READY_URL, timeout=2).status_code == 200:
+                print(f"[{time.strftime('%H:%M:%S')}] {GREEN}Monitor: API is ready.{NC}")
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(1)
+    print(f"[{time.strftime('%H:%M:%S')}] {YELLOW}Monitor: API not ready after {READY_TIMEOUT}s, starting checks anyway.{NC}")
+    return False
+
 def run_monitor():
     print(f"{GREEN}--- MLOps Model Monitor Started ---{NC}")
     print(f"{YELLOW}API URL: {API_URL}{NC}")
@@ -269,6 +351,7 @@ def run_monitor():
     print(f"{YELLOW}Drift after: {DRIFT_ITERATIONS} iterations{NC}")
     print(f"{YELLOW}Accuracy Threshold: {ACCURACY_THRESHOLD*100:.0f}%{NC}")
     print(f"{GREEN}-----------------------------------{NC}")
+    wait_for_api_ready()
 
     iteration = 0
     total_predictions = 0
@@ -323,6 +406,8 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 cd "$SCRIPT_DIR" || exit 1
 API="${API_URL:-http://localhost:5000}"
+echo "Checking API readiness at $API/ready ..."
+curl -sf "$API/ready" | grep -q '"ready":true' || { echo "FAIL: API not ready"; exit 1; }
 echo "Testing API at $API/predict ..."
 resp=$(curl -sf -X POST -H "Content-Type: application/json" -d '{"features":[[1.0, 0.5], [-0.5, 2.0]]}' "$API/predict")
 echo "$resp" | grep -q '"predictions"' || { echo "FAIL: no predictions in response"; exit 1; }
@@ -9,6 +9,8 @@ else
 fi
 echo "Running MLOps Compass demo (updates metrics.json)..."
 "$PYTHON_CMD" "$SCRIPT_DIR/src/mlops_compass.py" --demo
+echo "Running Monte Carlo simulation smoke test..."
+"$PYTHON_CMD" "$SCRIPT_DIR/src/mlops_compass.py" --simulate 10000 --seed 42 --json | grep '"overall_levels"' >/dev/null || { echo "FAIL: simulation produced no summary"; exit 1; }
 echo "Testing dashboard /api/metrics..."
 DASH_PORT="${DASHBOARD_PORT:-5001}"
 curl -sf "http://localhost:$DASH_PORT/api/metrics" | grep -q '"iteration"' || { echo "WARN: Dashboard not running or no metrics. Start with: $SCRIPT_DIR/start.sh"; exit 0; }
@@ -1,4 +1,4 @@
-"""MLOps Compass - Maturity assessment with optional --demo mode for dashboard metrics."""
+"""MLOps Compass - Maturity assessment with optional --demo mode for dashboard metrics and --simulate Monte Carlo mode."""
 import json
 import os
 import sys
@@ -18,6 +18,14 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+MATURITY_LEVELS = {
+    1: "Ad-Hoc/Manual",
+    2: "Repeatable/Automated",
+    3: "Managed/Standardized",
+    4: "Optimized/Autonomous"
+}
+
+
 def load_questions(filepath):
     """Loads questions from a JSON file."""
     if not os.path.exists(filepath):
@@ -82,12 +90,6 @@ def generate_report(dimension_scores, quiet=False):
         print(f"\n{Colors.HEADER}--- MLOps Maturity Report ---{Colors.ENDC}")
 
     overall_avg_score, total_questions, overall_total_score, overall_max_score = compute_overall(dimension_scores)
-    maturity_levels = {
-        1: "Ad-Hoc/Manual",
-        2: "Repeatable/Automated",
-        3: "Managed/Standardized",
-        4: "Optimized/Autonomous"
-    }
 
     if not quiet:
         print(f"\n{Colors.BOLD}Maturity by Dimension:{Colors.ENDC}")
@@ -99,7 +101,7 @@ def generate_report(dimension_scores, quiet=False):
             level_idx = int(round(avg_score))
             if level_idx < 1: level_idx = 1
             if level_idx > 4: level_idx = 4
-            print(f"  - {dim}: Average Score {avg_score:.2f} (Level {level_idx}: {maturity_levels.get(level_idx, 'Unknown')})")
+            print(f"  - {dim}: Average Score {avg_score:.2f} (Level {level_idx}: {MATURITY_LEVELS.get(level_idx, 'Unknown')})")
 
     overall_level_idx = int(round(overall_avg_score))
     if overall_level_idx < 1: overall_level_idx = 1
@@ -108,7 +110,7 @@ def generate_report(dimension_scores, quiet=False):
     if not quiet:
         print(f"\n{Colors.BOLD}Overall MLOps Maturity:{Colors.ENDC}")
         print(f"  Total Average Score: {overall_avg_score:.2f}")
-        print(f"  Maturity Level: {Colors.OKGREEN}Level {overall_level_idx}: {maturity_levels.get(overall_level_idx, 'Unknown')}{Colors.ENDC}")
+        print(f"  Maturity Level: {Colors.OKGREEN}Level {overall_level_idx}: {MATURITY_LEVELS.get(overall_level_idx, 'Unknown')}{Colors.ENDC}")
         print(f"\n{Colors.OKCYAN}-- Recommendations --{Colors.ENDC}")
         if overall_level_idx <= 2:
             print("  Focus on standardizing basic processes and implementing foundational tools for data versioning and experiment tracking.")
@@ -152,14 +154,192 @@ def write_metrics(project_root, overall_avg_score, overall_level_idx, total_ques
     return metrics_file
 
 
+def _require_numpy():
+    """Imports NumPy on demand; only simulation mode needs it."""
+    try:
+        import numpy as np
+    except ImportError:
+        print(f"{Colors.FAIL}Error: --simulate requires NumPy (pip install numpy){Colors.ENDC}")
+        sys.exit(1)
+    return np
+
+
+def load_distributions(filepath):
+    """Loads per-question answer distributions from a JSON file.
+
+    Keys are question ids (or "default"); values are relative weights for
+    options A, B, C, D... Weights are normalized, so counts work as well.
+    """
+    if not os.path.exists(filepath):
+        print(f"{Colors.FAIL}Error: Distributions file not found at {filepath}{Colors.ENDC}")
+        sys.exit(1)
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def build_score_model(questions_data, distributions=None):
+    """Flattens questions into arrays used by the vectorized scorer.
+
+    Returns (question_ids, dimensions, score_table, cdf, dim_weights):
+    score_table and cdf are (questions x max_options), dim_weights is
+    (questions x dimensions) with 1/len(dimension) for member questions.
+    """
+    np = _require_numpy()
+    distributions = distributions or {}
+    dimensions = list(questions_data.keys())
+    questions = [(dim_idx, q) for dim_idx, dim in enumerate(dimensions) for q in questions_data[dim]]
+    max_options = max(len(q['scores']) for _, q in questions)
+
+    score_table = np.zeros((len(questions), max_options))
+    probs = np.zeros((len(questions), max_options))
+    dim_weights = np.zeros((len(questions), len(dimensions)))
+    question_ids = []
+    for row, (dim_idx, q) in enumerate(questions):
+        n_opts = len(q['scores'])
+        question_ids.append(q.get('id', f"q{row + 1}"))
+        score_table[row, :n_opts] = q['scores']
+        score_table[row, n_opts:] = min(q['scores'])  # padding is never sampled
+        weights = distributions.get(question_ids[-1], distributions.get('default', [1.0] * n_opts))
+        if len(weights) != n_opts or min(weights) < 0 or sum(weights) <= 0:
+            print(f"{Colors.FAIL}Error: Invalid distribution for {question_ids[-1]}: expected {n_opts} non-negative weights{Colors.ENDC}")
+            sys.exit(1)
+        probs[row, :n_opts] = np.asarray(weights, dtype=float) / sum(weights)
+        dim_weights[row, dim_idx] = 1.0 / len(questions_data[dimensions[dim_idx]])
+
+    cdf = np.cumsum(probs, axis=1)
+    cdf[:, -1] = 1.0  # guard against float round-off leaving u > cdf[-1]
+    return question_ids, dimensions, score_table, cdf, dim_weights
+
+
+def score_to_level(avg_scores):
+    """Vectorized equivalent of the round-and-clamp used in generate_report."""
+    np = _require_numpy()
+    return np.clip(np.rint(avg_scores), 1, 4).astype(np.int8)
+
+
+def simulate_assessment(questions_data, n_samples, distributions=None, seed=None, chunk_size=250_000):
+    """Monte Carlo maturity simulation over random answer sets.
+
+    Draws n_samples answer sets from the per-question distributions and scores
+    each chunk in one pass over a (samples x questions) array. Returns a summary
+    dict with level distributions and per-question sensitivity of the overall level.
+    """
+    np = _require_numpy()
+    question_ids, dimensions, score_table, cdf, dim_weights = build_score_model(questions_data, distributions)
+    n_questions = len(question_ids)
+    rng = np.random.default_rng(seed)
+    row_idx = np.arange(n_questions)
+    q_min = score_table.min(axis=1)
+    q_max = score_table.max(axis=1)
+
+    overall_counts = np.zeros(5, dtype=np.int64)
+    dim_counts = np.zeros((len(dimensions), 5), dtype=np.int64)
+    overall_sum = 0.0
+    dim_sum = np.zeros(len(dimensions))
+    swing_sum = np.zeros(n_questions)
+    flip_count = np.zeros(n_questions, dtype=np.int64)
+
+    remaining = n_samples
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        remaining -= size
+        # Inverse-CDF sampling: option index = number of cdf steps below u
+        u = rng.random((size, n_questions, 1))
+        choices = (u > cdf[None, :, :]).sum(axis=2)
+        scores = score_table[row_idx, choices]
+
+        total = scores.sum(axis=1)
+        # compute_overall: total / (n * 4) * 4 is the plain mean of the scores
+        overall_avg = total / n_questions
+        dim_avg = scores @ dim_weights
+        overall_level = score_to_level(overall_avg)
+        overall_counts += np.bincount(overall_level, minlength=5)
+        for d in range(len(dimensions)):
+            dim_counts[d] += np.bincount(score_to_level(dim_avg[:, d]), minlength=5)
+        overall_sum += overall_avg.sum()
+        dim_sum += dim_avg.sum(axis=0)
+
+        # Sensitivity: swing each question from its lowest to highest score,
+        # holding the other sampled answers fixed, and see how the level moves.
+        others = total[:, None] - scores
+        level_lo = score_to_level((others + q_min) / n_questions)
+        level_hi = score_to_level((others + q_max) / n_questions)
+        swing = level_hi - level_lo
+        swing_sum += swing.sum(axis=0)
+        flip_count += (swing != 0).sum(axis=0)
+
+    def _distribution(counts):
+        return {level: round(int(counts[level]) / n_samples, 6) for level in MATURITY_LEVELS}
+
+    sensitivity = [
+        {
+            'question_id': qid,
+            'mean_level_swing': round(float(swing_sum[i]) / n_samples, 4),
+            'level_change_rate': round(int(flip_count[i]) / n_samples, 4),
+        }
+        for i, qid in enumerate(question_ids)
+    ]
+    sensitivity.sort(key=lambda s: (s['mean_level_swing'], s['level_change_rate']), reverse=True)
+    return {
+        'samples': n_samples,
+        'overall_mean_score': round(overall_sum / n_samples, 4),
+        'overall_levels': _distribution(overall_counts),
+        'dimensions': {
+            dim: {
+                'mean_score': round(float(dim_sum[d]) / n_samples, 4),
+                'levels': _distribution(dim_counts[d]),
+            }
+            for d, dim in enumerate(dimensions)
+        },
+        'sensitivity': sensitivity,
+    }
+
+
+def print_simulation_report(summary, questions_data, top_n=5):
+    """Prints the Monte Carlo summary produced by simulate_assessment."""
+    question_text = {q.get('id'): q['question'] for q_list in questions_data.values() for q in q_list}
+    print(f"\n{Colors.HEADER}--- MLOps Maturity Simulation ({summary['samples']:,} scenarios) ---{Colors.ENDC}")
+
+    print(f"\n{Colors.BOLD}Overall Maturity Distribution:{Colors.ENDC}")
+    print(f"  Mean Score: {summary['overall_mean_score']:.2f}")
+    for level, share in summary['overall_levels'].items():
+        print(f"  Level {level} ({MATURITY_LEVELS[level]}): {share * 100:6.2f}%")
+
+    print(f"\n{Colors.BOLD}Maturity by Dimension:{Colors.ENDC}")
+    for dim, stats in summary['dimensions'].items():
+        shares = ', '.join(f"L{level} {share * 100:.1f}%" for level, share in stats['levels'].items())
+        print(f"  - {dim}: Mean Score {stats['mean_score']:.2f} ({shares})")
+
+    print(f"\n{Colors.OKCYAN}-- Most Sensitive Questions (overall level swing, lowest to highest answer) --{Colors.ENDC}")
+    for s in summary['sensitivity'][:top_n]:
+        print(f"  {s['question_id']}: +{s['mean_level_swing']:.3f} levels, changes level in {s['level_change_rate'] * 100:.1f}% of scenarios")
+        print(f"      {question_text.get(s['question_id'], '')}")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='MLOps Maturity Assessment')
     parser.add_argument('--demo', action='store_true', help='Run with preset answers and write metrics.json for dashboard')
+    parser.add_argument('--simulate', type=int, metavar='N', help='Monte Carlo mode: score N random answer sets (requires NumPy)')
+    parser.add_argument('--distributions', metavar='FILE', help='JSON of per-question answer weights for --simulate (default: uniform)')
+    parser.add_argument('--seed', type=int, help='Random seed for --simulate')
+    parser.add_argument('--json', action='store_true', help='Print the --simulate summary as JSON')
     args = parser.parse_args()
 
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     questions_filepath = os.path.join(project_root, 'data', 'questions.json')
     questions = load_questions(questions_filepath)
+
+    if args.simulate is not None:
+        if args.simulate < 1:
+            parser.error('--simulate must be a positive number of scenarios')
+        distributions = load_distributions(args.distributions) if args.distributions else None
+        summary = simulate_assessment(questions, args.simulate, distributions=distributions, seed=args.seed)
+        if args.json:
+            print(json.dumps(summary, indent=2))
+        else:
+            print_simulation_report(summary, questions)
+        sys.exit(0)
+
     scores = run_assessment(questions, demo_mode=args.demo)
     overall_avg, level_idx, total_questions = generate_report(scores, quiet=args.demo)
 
@@ -111,8 +111,8 @@ fi
 echo "3. Setting up Python virtual environment..."
 python3 -m venv venv
 source venv/bin/activate
-pip install -q Flask
-echo "Flask installed for dashboard."
+pip install -q Flask numpy
+echo "Flask installed for dashboard, NumPy for --simulate."
 
 # 4. Generate Dashboard (metrics view)
 echo "4. Generating dashboard..."
@@ -262,6 +262,8 @@ else
 fi
 echo "Running MLOps Compass demo (updates metrics.json)..."
 "$PYTHON_CMD" "$SCRIPT_DIR/src/mlops_compass.py" --demo
+echo "Running Monte Carlo simulation smoke test..."
+"$PYTHON_CMD" "$SCRIPT_DIR/src/mlops_compass.py" --simulate 10000 --seed 42 --json | grep '"overall_levels"' >/dev/null || { echo "FAIL: simulation produced no summary"; exit 1; }
 echo "Testing dashboard /api/metrics..."
 DASH_PORT="${DASHBOARD_PORT:-5001}"
 curl -sf "http://localhost:$DASH_PORT/api/metrics" | grep -q '"iteration"' || { echo "WARN: Dashboard not running or no metrics. Start with: $SCRIPT_DIR/start.sh"; exit 0; }